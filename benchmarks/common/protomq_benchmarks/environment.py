@@ -4,9 +4,12 @@ Environment detection and system information collection.
 
 from dataclasses import dataclass, asdict
 from enum import StrEnum
+from functools import lru_cache
+import json
 import os
 import platform
 import subprocess
+import time
 import psutil
 from pathlib import Path
 
@@ -145,6 +148,20 @@ class Environment:
         """Convert to dictionary for JSON serialization"""
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Environment":
+        """Rebuild an Environment from its to_dict() representation"""
+        hardware = dict(data["hardware"])
+        hardware["cpu_arch"] = CpuArchitecture(hardware["cpu_arch"])
+        hardware["storage"] = StorageInfo(**hardware["storage"])
+
+        return cls(
+            hardware=HardwareInfo(**hardware),
+            software=SoftwareInfo(**data["software"]),
+            network=NetworkInfo(**data["network"]),
+            protomq=ProtoMQInfo(**data["protomq"])
+        )
+
 
 def detect_cpu_info() -> HardwareInfo:
     """Detect CPU and hardware information"""
@@ -202,6 +219,49 @@ def detect_cpu_info() -> HardwareInfo:
     )
 
 
+@lru_cache(maxsize=1)
+def get_server_process() -> psutil.Process:
+    """
+    Locate the running protomq-server process.
+
+    Resolution order, cheapest first:
+    1. PROTOMQ_SERVER_PIDFILE env var pointing at a pidfile (one read)
+    2. /proc/*/comm scan on Linux (one small read per pid)
+    3. Full psutil.process_iter scan (stats every process)
+
+    The resolved psutil.Process handle is cached for the benchmark's
+    lifetime either way.
+
+    Raises:
+        RuntimeError: if no protomq-server process is running
+    """
+    pidfile = os.environ.get("PROTOMQ_SERVER_PIDFILE")
+    if pidfile:
+        try:
+            return psutil.Process(int(Path(pidfile).read_text().strip()))
+        except (OSError, ValueError, psutil.NoSuchProcess):
+            pass  # Stale or unreadable pidfile, fall through to scanning
+
+    proc_root = Path("/proc")
+    if proc_root.is_dir():
+        for entry in proc_root.iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                if (entry / "comm").read_text().strip() == "protomq-server":
+                    return psutil.Process(int(entry.name))
+            except (OSError, psutil.NoSuchProcess):
+                continue  # Process exited mid-scan
+
+    for proc in psutil.process_iter(["name"]):
+        if proc.info["name"] == "protomq-server":
+            return psutil.Process(proc.pid)
+
+    raise RuntimeError(
+        "Could not find protomq-server process. Is the server running?"
+    )
+
+
 def detect_build_mode() -> str:
     """Detect if ProtoMQ binaries are optimized"""
     try:
@@ -290,8 +350,64 @@ def get_hardware_dir_name(env: Environment) ->str:
     return f"{os_name}_{os_version}_{cpu_model}_{arch}"
 
 
+# On-disk environment cache used by PROTOMQ_BENCH_FAST runs. Keyed by
+# uname so a copied results directory never leaks another host's data.
+_ENV_CACHE_TTL_S = 3600
+_ENV_CACHE_FILE = Path(__file__).parent.parent.parent / "results" / ".env_cache.json"
+
+
+def _load_env_cache() -> Environment | None:
+    """Load a fresh-enough cached environment snapshot, if any"""
+    try:
+        if time.time() - _ENV_CACHE_FILE.stat().st_mtime > _ENV_CACHE_TTL_S:
+            return None
+
+        data = json.loads(_ENV_CACHE_FILE.read_text())
+        if data.get("uname") != " ".join(platform.uname()):
+            return None
+
+        return Environment.from_dict(data["environment"])
+    except Exception:
+        return None
+
+
+def _store_env_cache(env: Environment):
+    """Persist the environment snapshot for later PROTOMQ_BENCH_FAST runs"""
+    try:
+        _ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _ENV_CACHE_FILE.write_text(json.dumps({
+            "uname": " ".join(platform.uname()),
+            "environment": env.to_dict()
+        }, default=str))
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=1)
 def collect_environment() -> Environment:
-    """Collect complete environment information"""
+    """
+    Collect complete environment information.
+
+    The snapshot is memoized for the process. With PROTOMQ_BENCH_FAST=1,
+    a recent on-disk snapshot (1 hour TTL) is reused across processes so
+    warm CI runs skip the diskutil/sysctl/file/git subprocess probes.
+    """
+    use_disk_cache = os.environ.get("PROTOMQ_BENCH_FAST") == "1"
+
+    if use_disk_cache:
+        cached = _load_env_cache()
+        if cached is not None:
+            return cached
+
+    env = _collect_environment()
+
+    if use_disk_cache:
+        _store_env_cache(env)
+    return env
+
+
+def _collect_environment() -> Environment:
+    """Collect environment information from the live system"""
     hardware = detect_cpu_info()
     
     software = SoftwareInfo(
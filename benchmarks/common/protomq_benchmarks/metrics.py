@@ -2,12 +2,23 @@
 Metric collection utilities for benchmarks.
 """
 
+import array
 import time
 import psutil
 import asyncio
 from dataclasses import dataclass
 from statistics import quantiles
 
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python percentiles still work without it
+    np = None
+
+try:
+    from tdigest import TDigest
+except ImportError:  # Optional: falls back to exact (buffered) percentiles
+    TDigest = None
+
 
 class Timer:
     """Context manager for measuring elapsed time"""
@@ -34,65 +45,68 @@ class Timer:
         return self.elapsed_s() * 1000
 
 
-def measure_memory(pid: int | None = None) -> float:
+def _resolve_process(pid: int | psutil.Process | None) -> psutil.Process:
+    """Accept an already-constructed Process to skip re-resolving the pid"""
+    if isinstance(pid, psutil.Process):
+        return pid
+    return psutil.Process(pid) if pid else psutil.Process()
+
+
+def measure_memory(pid: int | psutil.Process | None = None) -> float:
     """
     Measure memory usage in MB.
-    
+
     Args:
-        pid: Process ID to measure (defaults to current process)
-    
+        pid: Process ID or psutil.Process to measure (defaults to current process)
+
     Returns:
         RSS memory in MB
     """
-    process = psutil.Process(pid) if pid else psutil.Process()
-    return process.memory_info().rss / (1024 * 1024)
+    return _resolve_process(pid).memory_info().rss / (1024 * 1024)
 
 
-def measure_cpu(pid: int | None = None, interval: float = 1.0) -> float:
+def measure_cpu(pid: int | psutil.Process | None = None, interval: float = 1.0) -> float:
     """
     Measure CPU usage percentage.
-    
+
     Args:
-        pid: Process ID to measure (defaults to current process)
+        pid: Process ID or psutil.Process to measure (defaults to current process)
         interval: Measurement interval in seconds
-    
+
     Returns:
         CPU percentage (0-100 per core, can exceed 100 on multi-core)
     """
-    process = psutil.Process(pid) if pid else psutil.Process()
-    return process.cpu_percent(interval=interval)
+    return _resolve_process(pid).cpu_percent(interval=interval)
+
+
+def _nearest_rank_index(p: float, n: int) -> int:
+    """Index of the nearest-rank percentile, clamped to a valid position"""
+    return min(int((p / 100) * n), n - 1)
+
+
+def _percentile_of_sorted(sorted_values, p) -> float:
+    """Nearest-rank percentile of an already-sorted sequence"""
+    return sorted_values[_nearest_rank_index(p, len(sorted_values))]
 
 
 def calculate_percentile(values: list[float], p: int) -> float:
     """
     Calculate the p-th percentile of a list of values.
-    
+
     Uses the nearest-rank method (standard definition).
     For p99 with 100 values, this returns the 99th value when sorted.
-    
+
     Args:
         values: List of numeric values
         p: Percentile (0-100)
-    
+
     Returns:
         The p-th percentile value
     """
     if not values:
         return 0.0
-    
-    sorted_values = sorted(values)
-    n = len(sorted_values)
-    
-    # Nearest-rank method
-    rank = int((p / 100) * n)
-    
-    # Clamp to valid index
-    if rank >= n:
-        return sorted_values[-1]
-    if rank == 0:
-        return sorted_values[0]
-    
-    return sorted_values[rank]
+
+    return _percentile_of_sorted(sorted(values), p)
 
 
 @dataclass
@@ -108,23 +122,101 @@ class LatencyStats:
     p999: float | None = None
     
     @classmethod
-    def from_measurements(cls, latencies: list[float]) -> "LatencyStats":
+    def from_measurements(cls, latencies: "list[float] | array.array") -> "LatencyStats":
         """Calculate statistics from raw latency measurements"""
         if not latencies:
             return cls(0, 0, 0, 0, 0, 0, 0)
-        
+
+        n = len(latencies)
+
+        if np is not None:
+            # One C-implemented sort, then index it with the exact same
+            # nearest-rank rule as the pure-Python path: np.quantile's
+            # estimators interpolate differently, and the summary must
+            # not depend on whether an optional package is installed.
+            if isinstance(latencies, array.array) and latencies.typecode == "d":
+                # array('d') shares NumPy's memory layout: no copy needed
+                arr = np.frombuffer(latencies, dtype=np.float64)
+            else:
+                arr = np.asarray(latencies, dtype=np.float64)
+            sorted_arr = np.sort(arr)
+            return cls(
+                min=float(sorted_arr[0]),
+                max=float(sorted_arr[-1]),
+                mean=float(arr.mean()),
+                median=float(sorted_arr[n // 2]),
+                p50=float(sorted_arr[_nearest_rank_index(50, n)]),
+                p95=float(sorted_arr[_nearest_rank_index(95, n)]),
+                p99=float(sorted_arr[_nearest_rank_index(99, n)]),
+                p999=float(sorted_arr[_nearest_rank_index(99.9, n)]) if n >= 1000 else None
+            )
+
         sorted_lat = sorted(latencies)
-        n = len(sorted_lat)
-        
+
         return cls(
             min=sorted_lat[0],
             max=sorted_lat[-1],
             mean=sum(sorted_lat) / n,
             median=sorted_lat[n // 2],
-            p50=calculate_percentile(latencies, 50),
-            p95=calculate_percentile(latencies, 95),
-            p99=calculate_percentile(latencies, 99),
-            p999=calculate_percentile(latencies, 99.9) if n >= 1000 else None
+            p50=_percentile_of_sorted(sorted_lat, 50),
+            p95=_percentile_of_sorted(sorted_lat, 95),
+            p99=_percentile_of_sorted(sorted_lat, 99),
+            p999=_percentile_of_sorted(sorted_lat, 99.9) if n >= 1000 else None
+        )
+
+
+class StreamingLatencyStats:
+    """Streaming latency aggregator with bounded memory.
+
+    Benchmarks can feed one sample per operation via add() instead of
+    retaining every measurement in a list. With the optional `tdigest`
+    package the sketch keeps memory at a few KB regardless of sample
+    count (percentile error <0.2%); without it, samples are buffered and
+    summarized exactly on finalize().
+    """
+
+    def __init__(self):
+        self._digest = TDigest() if TDigest is not None else None
+        # array('d') stores 8 bytes per sample contiguously vs ~56 bytes
+        # for a GC-tracked Python float in a list slot
+        self._samples = array.array("d")
+        self._count = 0
+        self._total = 0.0
+        self._min = float("inf")
+        self._max = float("-inf")
+
+    def add(self, latency_ms: float):
+        """Record a single latency sample (O(1))"""
+        self._count += 1
+        self._total += latency_ms
+        if latency_ms < self._min:
+            self._min = latency_ms
+        if latency_ms > self._max:
+            self._max = latency_ms
+
+        if self._digest is not None:
+            self._digest.update(latency_ms)
+        else:
+            self._samples.append(latency_ms)
+
+    def finalize(self) -> LatencyStats:
+        """Summarize all recorded samples"""
+        if self._count == 0:
+            return LatencyStats(0, 0, 0, 0, 0, 0, 0)
+
+        if self._digest is None:
+            return LatencyStats.from_measurements(self._samples)
+
+        p50 = self._digest.percentile(50)
+        return LatencyStats(
+            min=self._min,
+            max=self._max,
+            mean=self._total / self._count,
+            median=p50,
+            p50=p50,
+            p95=self._digest.percentile(95),
+            p99=self._digest.percentile(99),
+            p999=self._digest.percentile(99.9) if self._count >= 1000 else None
         )
 
 
@@ -6,6 +6,12 @@ from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is the fallback parser
+    orjson = None
 
 
 class ThresholdDirection(StrEnum):
@@ -24,30 +30,53 @@ class Threshold:
     warn_value: float | None = None
     description: str | None = None
     
-    def check(self, value: float) -> tuple[str, str | None]:
-        """
-        Check value against threshold.
-        Returns (status, message) where status is "OK", "WARN", or "FAIL"
-        """
+    def __post_init__(self):
+        # A Threshold is immutable after add_threshold, so its JSON view
+        # is frozen once here instead of rebuilt for every checked metric
+        self._dict_view = {
+            "direction": self.direction,
+            "min": self.min_value,
+            "max": self.max_value,
+            "warn": self.warn_value
+        }
+        # Resolve the direction branch once at construction: check(value)
+        # returns (status, message) where status is "OK", "WARN" or "FAIL"
         if self.direction == ThresholdDirection.LOWER_IS_BETTER:
-            # For "lower is better" metrics (latency, memory)
-            if self.max_value is not None and value > self.max_value:
-                return ("FAIL", f"{self.metric}={value} exceeds max={self.max_value}")
-            if self.warn_value is not None and value > self.warn_value:
-                return ("WARN", f"{self.metric}={value} exceeds warn={self.warn_value}")
-            if self.min_value is not None and value < self.min_value:
-                return ("FAIL", f"{self.metric}={value} below min={self.min_value}")
+            self.check = self._check_lower
         else:
-            # For "higher is better" metrics (throughput, connections)
-            if self.min_value is not None and value < self.min_value:
-                return ("FAIL", f"{self.metric}={value} below min={self.min_value}")
-            if self.warn_value is not None and value < self.warn_value:
-                return ("WARN", f"{self.metric}={value} below warn={self.warn_value}")
-            if self.max_value is not None and value > self.max_value:
-                return ("FAIL", f"{self.metric}={value} exceeds max={self.max_value}")
-        
+            self.check = self._check_higher
+
+    def _check_lower(self, value: float) -> tuple[str, str | None]:
+        """Check for "lower is better" metrics (latency, memory)"""
+        if self.max_value is not None and value > self.max_value:
+            return ("FAIL", f"{self.metric}={value} exceeds max={self.max_value}")
+        if self.warn_value is not None and value > self.warn_value:
+            return ("WARN", f"{self.metric}={value} exceeds warn={self.warn_value}")
+        if self.min_value is not None and value < self.min_value:
+            return ("FAIL", f"{self.metric}={value} below min={self.min_value}")
+
         return ("OK", None)
 
+    def _check_higher(self, value: float) -> tuple[str, str | None]:
+        """Check for "higher is better" metrics (throughput, connections)"""
+        if self.min_value is not None and value < self.min_value:
+            return ("FAIL", f"{self.metric}={value} below min={self.min_value}")
+        if self.warn_value is not None and value < self.warn_value:
+            return ("WARN", f"{self.metric}={value} below warn={self.warn_value}")
+        if self.max_value is not None and value > self.max_value:
+            return ("FAIL", f"{self.metric}={value} exceeds max={self.max_value}")
+
+        return ("OK", None)
+
+
+# Status-to-symbol mapping for print_summary, built once at import
+_STATUS_SYMBOLS = {
+    "OK": "[PASS]",
+    "WARN": "[WARN]",
+    "FAIL": "[FAIL]",
+    "SKIP": "[SKIP]"
+}
+
 
 class ThresholdChecker:
     """Manages and validates benchmark thresholds"""
@@ -89,9 +118,12 @@ class ThresholdChecker:
             }
         }
         """
-        with open(path) as f:
-            data = json.load(f)
-        
+        if orjson is not None:
+            data = orjson.loads(Path(path).read_bytes())
+        else:
+            with open(path) as f:
+                data = json.load(f)
+
         for metric, config in data.items():
             direction = ThresholdDirection(config.get("direction", "lower"))
             self.add_threshold(
@@ -115,6 +147,19 @@ class ThresholdChecker:
             "details": {metric: {status, value, threshold}}
         }
         """
+        if not self.thresholds:
+            # Nothing registered (common for ad-hoc runs): every metric
+            # is a SKIP, so the per-metric lookup loop can be skipped
+            return {
+                "passed": True,
+                "warnings": [],
+                "failures": [],
+                "details": {
+                    metric: {"status": "SKIP", "value": value, "threshold": None}
+                    for metric, value in results.items()
+                }
+            }
+
         warnings = []
         failures = []
         details = {}
@@ -135,12 +180,7 @@ class ThresholdChecker:
             details[metric] = {
                 "status": status,
                 "value": value,
-                "threshold": {
-                    "direction": threshold.direction,
-                    "min": threshold.min_value,
-                    "max": threshold.max_value,
-                    "warn": threshold.warn_value
-                }
+                "threshold": threshold._dict_view
             }
             
             if status == "FAIL":
@@ -157,46 +197,45 @@ class ThresholdChecker:
     
     def print_summary(self, status: dict):
         """Pretty-print threshold check results"""
-        print("\n" + "="*60)
-        print("THRESHOLD CHECK RESULTS")
-        print("="*60)
-        
+        # Build the whole report in memory and emit it with one write:
+        # a print per metric means one syscall per line once thresholds
+        # grow, and the per-line dict literal was rebuilt every time
+        parts = ["", "="*60, "THRESHOLD CHECK RESULTS", "="*60]
+
         for metric, detail in status["details"].items():
-            status_symbol = {
-                "OK": "[PASS]",
-                "WARN": "[WARN]",
-                "FAIL": "[FAIL]",
-                "SKIP": "[SKIP]"
-            }[detail["status"]]
-            
-            print(f"{status_symbol} {metric}: {detail['value']}")
-            
+            parts.append(
+                "%s %s: %s" % (_STATUS_SYMBOLS[detail["status"]], metric, detail["value"])
+            )
+
             if detail["threshold"]:
                 th = detail["threshold"]
-                print(f"   Direction: {th['direction']}")
+                parts.append("   Direction: %s" % th["direction"])
                 if th["min"] is not None:
-                    print(f"   Min: {th['min']}")
+                    parts.append("   Min: %s" % th["min"])
                 if th["max"] is not None:
-                    print(f"   Max: {th['max']}")
+                    parts.append("   Max: %s" % th["max"])
                 if th["warn"] is not None:
-                    print(f"   Warn: {th['warn']}")
-        
-        print("\n" + "-"*60)
+                    parts.append("   Warn: %s" % th["warn"])
+
+        parts.append("")
+        parts.append("-"*60)
         if status["failures"]:
-            print("FAILURES:")
+            parts.append("FAILURES:")
             for failure in status["failures"]:
-                print(f"   - {failure}")
-        
+                parts.append("   - %s" % failure)
+
         if status["warnings"]:
-            print("WARNINGS:")
+            parts.append("WARNINGS:")
             for warning in status["warnings"]:
-                print(f"   - {warning}")
-        
+                parts.append("   - %s" % warning)
+
         if status["passed"] and not status["warnings"]:
-            print("ALL THRESHOLDS PASSED")
+            parts.append("ALL THRESHOLDS PASSED")
         elif status["passed"]:
-            print("PASSED (with warnings)")
+            parts.append("PASSED (with warnings)")
         else:
-            print("FAILED")
-        
-        print("="*60 + "\n")
+            parts.append("FAILED")
+
+        parts.append("="*60)
+        parts.append("")
+        sys.stdout.write("\n".join(parts) + "\n")
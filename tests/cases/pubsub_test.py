@@ -3,61 +3,91 @@ import time
 import struct
 import sys
 
-def encode_string(s):
-    encoded = s.encode('utf-8')
-    return struct.pack("!H", len(encoded)) + encoded
+# Reused packer/unpacker for the 2-byte length prefix used everywhere
+STRUCT_H = struct.Struct("!H")
+
+# Each builder fills one pre-sized bytearray instead of concatenating
+# header/var-header/payload bytes objects (one allocation per packet).
 
 def create_connect(client_id):
     # Fixed header: CONNECT (1<<4), remaining length
     var_header = b"\x00\x04MQTT\x04\x02\x00\x3C" # Protocol name, level 4, flags 0x02, keepalive 60
-    payload = encode_string(client_id)
-    remaining_length = len(var_header) + len(payload)
-    
-    header = b"\x10" + bytes([remaining_length])
-    return header + var_header + payload
+    cid = client_id.encode('utf-8')
+    remaining_length = len(var_header) + 2 + len(cid)
+
+    packet = bytearray(2 + remaining_length)
+    packet[0] = 0x10
+    packet[1] = remaining_length
+    packet[2:2 + len(var_header)] = var_header
+    STRUCT_H.pack_into(packet, 2 + len(var_header), len(cid))
+    packet[4 + len(var_header):] = cid
+    return bytes(packet)
 
 def create_subscribe(packet_id, topic):
     # SUBSCRIBE (8<<4 | 2) = 0x82
-    var_header = struct.pack("!H", packet_id)
-    payload = encode_string(topic) + b"\x00" # QoS 0
-    remaining_length = len(var_header) + len(payload)
-    
-    header = b"\x82" + bytes([remaining_length])
-    return header + var_header + payload
+    topic_bytes = topic.encode('utf-8')
+    remaining_length = 2 + 2 + len(topic_bytes) + 1
+
+    packet = bytearray(2 + remaining_length)
+    packet[0] = 0x82
+    packet[1] = remaining_length
+    STRUCT_H.pack_into(packet, 2, packet_id)
+    STRUCT_H.pack_into(packet, 4, len(topic_bytes))
+    packet[6:6 + len(topic_bytes)] = topic_bytes
+    packet[6 + len(topic_bytes)] = 0x00 # QoS 0
+    return bytes(packet)
 
 def create_publish(topic, message):
     # PUBLISH (3<<4) = 0x30 (QoS 0)
-    var_header = encode_string(topic)
-    payload = message.encode('utf-8')
-    remaining_length = len(var_header) + len(payload)
-    
-    header = b"\x30" + bytes([remaining_length])
-    return header + var_header + payload
+    topic_bytes = topic.encode('utf-8')
+    msg_bytes = message.encode('utf-8')
+    remaining_length = 2 + len(topic_bytes) + len(msg_bytes)
+
+    packet = bytearray(2 + remaining_length)
+    packet[0] = 0x30
+    packet[1] = remaining_length
+    STRUCT_H.pack_into(packet, 2, len(topic_bytes))
+    packet[4:4 + len(topic_bytes)] = topic_bytes
+    packet[4 + len(topic_bytes):] = msg_bytes
+    return bytes(packet)
+
+def read_packet(rd):
+    # rd is a buffered reader (sock.makefile). peek exposes the fixed
+    # header (type byte + up to 4 remaining-length bytes) without
+    # consuming it, so the whole packet is drained with one read call
+    # instead of a per-byte varint loop.
+    head = rd.peek(5)
+    if not head:
+        return None, None
 
-def read_packet(sock):
-    # Read fixed header
-    byte1 = sock.recv(1)
-    if not byte1: return None, None
-    
-    # Read remaining length
     multiplier = 1
     value = 0
-    while True:
-        b = sock.recv(1)
-        if not b: return None, None
-        byte = b[0]
+    hdr_len = 1
+    for byte in head[1:5]:
+        hdr_len += 1
         value += (byte & 127) * multiplier
         multiplier *= 128
         if (byte & 128) == 0:
             break
-            
-    # Read payload
-    payload = b""
-    if value > 0:
-        payload = sock.recv(value)
-        
-    packet_type = byte1[0] >> 4
-    return packet_type, payload
+    else:
+        # Readahead ended mid-varint (buffer boundary): consume what was
+        # inspected and finish the decode byte by byte
+        rd.read(hdr_len)
+        while True:
+            b = rd.read(1)
+            if not b: return None, None
+            byte = b[0]
+            value += (byte & 127) * multiplier
+            multiplier *= 128
+            if (byte & 128) == 0:
+                break
+        payload = rd.read(value) if value > 0 else b""
+        return head[0] >> 4, payload
+
+    packet = rd.read(hdr_len + value)
+    if len(packet) < hdr_len + value:
+        return None, None
+    return packet[0] >> 4, packet[hdr_len:]
 
 print("🧪 ProtoMQ Pub/Sub Integration Test")
 print("==============================")
@@ -66,11 +96,12 @@ print("==============================")
 try:
     sub_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sub_sock.connect(("localhost", 1883))
+    sub_rd = sub_sock.makefile('rb', buffering=8192)
     print("✅ Subscriber connected")
-    
+
     # Send CONNECT
     sub_sock.send(create_connect("sub1"))
-    type, _ = read_packet(sub_sock)
+    type, _ = read_packet(sub_rd)
     if type == 2: # CONNACK
         print("✅ Subscriber received CONNACK")
     else:
@@ -79,7 +110,7 @@ try:
         
     # Send SUBSCRIBE
     sub_sock.send(create_subscribe(1, "test/topic"))
-    type, _ = read_packet(sub_sock)
+    type, _ = read_packet(sub_rd)
     if type == 9: # SUBACK
         print("✅ Subscriber received SUBACK")
     else:
@@ -94,11 +125,12 @@ except Exception as e:
 try:
     pub_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     pub_sock.connect(("localhost", 1883))
+    pub_rd = pub_sock.makefile('rb', buffering=8192)
     print("✅ Publisher connected")
-    
+
     # Send CONNECT
     pub_sock.send(create_connect("pub1"))
-    type, _ = read_packet(pub_sock)
+    type, _ = read_packet(pub_rd)
     if type == 2: # CONNACK
         print("✅ Publisher received CONNACK")
     
@@ -109,12 +141,12 @@ try:
     
     # Check Subscriber received it
     sub_sock.settimeout(2.0)
-    type, payload = read_packet(sub_sock)
+    type, payload = read_packet(sub_rd)
     
     if type == 3: # PUBLISH
         # Parse PUBLISH payload (parsing simplified)
         # Topic len (2 bytes), Topic, Payload
-        topic_len = struct.unpack("!H", payload[0:2])[0]
+        topic_len = STRUCT_H.unpack(payload[0:2])[0]
         topic = payload[2:2+topic_len].decode('utf-8')
         received_msg = payload[2+topic_len:].decode('utf-8')
         